@@ -27,15 +27,15 @@ list_of_paths = [
     "src/model_artifacts/"
 ]
 
-for path in list_of_paths:
-    path = Path(path)
-    
-    # If path is a directory (ends with slash or has no suffix), create it
-    if path.suffix == "":
-        path.mkdir(parents=True, exist_ok=True)
-    else:
-        # Otherwise, treat it as a file
-        path.parent.mkdir(parents=True, exist_ok=True)
-        if not path.exists() or path.stat().st_size == 0:
-            with open(path, "w") as f:
-                pass
+paths = [Path(path) for path in list_of_paths]
+
+# Create every directory once: explicit directory entries plus the parents of files
+directories = {path for path in paths if path.suffix == ""}
+directories |= {path.parent for path in paths if path.suffix != ""}
+for directory in directories:
+    directory.mkdir(parents=True, exist_ok=True)
+
+# Create missing files; existing files are left untouched
+for path in paths:
+    if path.suffix != "" and not path.exists():
+        path.touch()